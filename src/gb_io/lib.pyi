@@ -46,11 +46,13 @@ class Record:
         references: Optional[Iterable[Reference]] = None,
         features: Optional[Iterable[Feature]] = None,
     ): ...
+    def __copy__(self) -> Record: ...
 
 class Source:
     name: str
     organism: Optional[str]
     def __init__(self, name: str, organism: Optional[str]): ...
+    def __copy__(self) -> Source: ...
     def __repr__(self) -> str: ...
 
 class Feature:
@@ -60,12 +62,14 @@ class Feature:
     def __init__(
         self, kind: str, location: Location, qualifiers: Optional[List[Qualifier]]
     ): ...
+    def __copy__(self) -> Feature: ...
     def __repr__(self) -> str: ...
 
 class Qualifier:
     key: str
     value: Optional[str]
     def __init__(self, key: str, value: Optional[str] = None): ...
+    def __copy__(self) -> Qualifier: ...
     def __repr__(self) -> str: ...
 
 class Location:
@@ -81,6 +85,7 @@ class Range(Location):
     def __init__(
         self, start: int, end: int, before: bool = False, after: bool = False
     ): ...
+    def __copy__(self) -> Range: ...
     def __repr__(self) -> str: ...
 
 class Between(Location):
@@ -89,6 +94,7 @@ class Between(Location):
     @property
     def strand(self) -> _STRAND: ...
     def __init__(self, start: int, end: int): ...
+    def __copy__(self) -> Between: ...
     def __repr__(self) -> str: ...
 
 class Complement(Location):
@@ -100,6 +106,7 @@ class Complement(Location):
     @property
     def strand(self) -> _STRAND: ...
     def __init__(self, location: Location): ...
+    def __copy__(self) -> Complement: ...
     def __repr__(self) -> str: ...
 
 class Join(Location):
@@ -109,27 +116,32 @@ class Join(Location):
     @property
     def end(self) -> int: ...
     def __init__(self, locations: List[Location]): ...
+    def __copy__(self) -> Join: ...
     def __repr__(self) -> str: ...
 
 class Order(Location):
     locations: List[Location]
     def __init__(self, locations: List[Location]): ...
+    def __copy__(self) -> Order: ...
     def __repr__(self) -> str: ...
 
 class Bond(Location):
     locations: List[Location]
     def __init__(self, locations: List[Location]): ...
+    def __copy__(self) -> Bond: ...
     def __repr__(self) -> str: ...
 
 class OneOf(Location):
     locations: List[Location]
     def __init__(self, locations: List[Location]): ...
+    def __copy__(self) -> OneOf: ...
     def __repr__(self) -> str: ...
 
 class External(Location):
     accession: str
     location: Optional[Location]
     def __init__(self, accession: str, location: Optional[Location] = None): ...
+    def __copy__(self) -> External: ...
     def __repr__(self) -> str: ...
 
 class Reference:
@@ -140,6 +152,7 @@ class Reference:
     journal: Optional[str]
     pubmed: Optional[str]
     remark: Optional[str]
+    def __copy__(self) -> Reference: ...
 
 def load(fh: Union[str, BinaryIO]) -> List[Record]: ...
 def iter(fh: Union[str, BinaryIO]) -> Iterator[Record]: ...
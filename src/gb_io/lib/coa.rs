@@ -3,11 +3,116 @@ use std::sync::RwLock;
 
 use pyo3::prelude::*;
 use pyo3::pyclass::PyClass;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::PyByteArray;
 use pyo3::types::PyList;
 use pyo3::types::PyString;
 use pyo3::PyTypeInfo;
 
+/// The feature kinds and qualifier keys most commonly found in GenBank files.
+const KNOWN_STRINGS: &[&str] = &[
+    // feature kinds
+    "source",
+    "gene",
+    "CDS",
+    "mRNA",
+    "tRNA",
+    "rRNA",
+    "ncRNA",
+    "tmRNA",
+    "misc_RNA",
+    "precursor_RNA",
+    "prim_transcript",
+    "exon",
+    "intron",
+    "5'UTR",
+    "3'UTR",
+    "regulatory",
+    "sig_peptide",
+    "mat_peptide",
+    "transit_peptide",
+    "propeptide",
+    "misc_feature",
+    "misc_binding",
+    "misc_difference",
+    "misc_recomb",
+    "misc_structure",
+    "repeat_region",
+    "mobile_element",
+    "rep_origin",
+    "oriT",
+    "protein_bind",
+    "primer_bind",
+    "stem_loop",
+    "modified_base",
+    "variation",
+    "operon",
+    "gap",
+    "assembly_gap",
+    "STS",
+    "polyA_site",
+    "centromere",
+    "telomere",
+    "D-loop",
+    // qualifier keys
+    "locus_tag",
+    "old_locus_tag",
+    "gene_synonym",
+    "product",
+    "protein_id",
+    "translation",
+    "transl_table",
+    "transl_except",
+    "codon_start",
+    "note",
+    "db_xref",
+    "inference",
+    "experiment",
+    "function",
+    "EC_number",
+    "pseudo",
+    "standard_name",
+    "allele",
+    "label",
+    "exception",
+    "ribosomal_slippage",
+    "anticodon",
+    "ncRNA_class",
+    "regulatory_class",
+    "rpt_type",
+    "rpt_unit_seq",
+    "bound_moiety",
+    "mobile_element_type",
+    "organism",
+    "mol_type",
+    "strain",
+    "sub_strain",
+    "isolate",
+    "serotype",
+    "serovar",
+    "host",
+    "lab_host",
+    "country",
+    "collection_date",
+    "plasmid",
+    "chromosome",
+    "map",
+    "clone",
+    "cell_line",
+    "tissue_type",
+];
+
+/// Get the table of interned Python strings for the `KNOWN_STRINGS`.
+fn known_strings(py: Python) -> &'static HashMap<&'static str, Py<PyString>> {
+    static KNOWN: GILOnceCell<HashMap<&'static str, Py<PyString>>> = GILOnceCell::new();
+    KNOWN.get_or_init(py, || {
+        KNOWN_STRINGS
+            .iter()
+            .map(|s| (*s, PyString::intern(py, s).unbind()))
+            .collect()
+    })
+}
+
 #[derive(Debug, Default)]
 pub struct PyInterner {
     cache: RwLock<HashMap<String, Py<PyString>>>,
@@ -16,6 +121,9 @@ pub struct PyInterner {
 impl PyInterner {
     pub fn intern<S: AsRef<str>>(&self, py: Python, s: S) -> Py<PyString> {
         let key = s.as_ref();
+        if let Some(pystring) = known_strings(py).get(key) {
+            return pystring.clone_ref(py);
+        }
         if let Some(pystring) = self
             .cache
             .read()
@@ -8,10 +8,13 @@ mod coa;
 mod pyfile;
 mod reader;
 
+use std::cell::Cell;
 use std::convert::Infallible;
+use std::io::BufWriter;
 use std::io::Read;
 use std::io::Write;
 use std::ops::DerefMut;
+use std::path::PathBuf;
 
 use gb_io::reader::GbParserError;
 use gb_io::reader::SeqReader;
@@ -27,6 +30,7 @@ use pyo3::exceptions::PyOSError;
 use pyo3::exceptions::PyTypeError;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::pyclass::PyClass;
 use pyo3::types::PyByteArray;
 use pyo3::types::PyDate;
 use pyo3::types::PyDateAccess;
@@ -41,13 +45,21 @@ use self::coa::Convert;
 use self::coa::Extract;
 use self::coa::PyInterner;
 use self::coa::Temporary;
-use self::pyfile::PyFileRead;
+use self::pyfile::PyFileGILRead;
 use self::pyfile::PyFileWrite;
+use self::reader::parse_slice;
+use self::reader::Handle;
 use self::reader::RecordReader;
 
 // ---------------------------------------------------------------------------
 
 /// A single GenBank record.
+///
+/// Records obtained from `load` or `iter` keep their features, references
+/// and sequence as native data until the corresponding attribute is first
+/// accessed, so code only reading the record metadata never pays for the
+/// creation of the nested Python objects.
+///
 #[pyclass(module = "gb_io")]
 #[derive(Debug, Clone)]
 pub struct Record {
@@ -195,6 +207,25 @@ impl Record {
         Ok(PyClassInitializer::from(record))
     }
 
+    fn __copy__<'py>(mut slf: PyRefMut<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        let record = slf.deref_mut();
+        // convert nested attributes so they are shared with the copy
+        if let Some(date) = record.date.as_mut() {
+            date.to_shared(py)?;
+        }
+        if let Some(source) = record.source.as_mut() {
+            source.to_shared(py)?;
+        }
+        if let Some(contig) = record.contig.as_mut() {
+            contig.to_shared(py)?;
+        }
+        record.references.to_shared(py)?;
+        record.sequence.to_shared(py)?;
+        record.features.to_shared(py)?;
+        Py::new(py, record.clone())
+    }
+
     /// `bool`: Whether the record describes a circular molecule.
     #[getter]
     fn get_circular(slf: PyRef<'_, Self>) -> bool {
@@ -233,7 +264,11 @@ impl Record {
         Ok(())
     }
 
-    /// `bytes`: The sequence of the record in lowercase, as raw ASCII.
+    /// `bytearray`: The sequence of the record in lowercase, as raw ASCII.
+    ///
+    /// The `bytearray` is created on first access and then shared, so it
+    /// can be passed to any consumer of the buffer protocol (such as
+    /// `memoryview` or `numpy.frombuffer`) without copying the sequence.
     #[getter]
     fn get_sequence(mut slf: PyRefMut<'_, Self>) -> PyResult<Py<PyByteArray>> {
         let py = slf.py();
@@ -272,7 +307,14 @@ impl Record {
 
 impl Convert for gb_io::seq::Seq {
     type Output = Record;
-    fn convert_with(self, py: Python, _interner: &mut PyInterner) -> PyResult<Py<Self::Output>> {
+    fn convert_with(
+        mut self,
+        py: Python,
+        _interner: &mut PyInterner,
+    ) -> PyResult<Py<Self::Output>> {
+        // the sequence is kept as native data until it is accessed, so
+        // release any capacity left over by the parser in the meantime
+        self.seq.shrink_to_fit();
         Py::new(
             py,
             Record {
@@ -366,6 +408,16 @@ impl Source {
             PyString::new(py, "Source({!r})").call_method1("format", (name,))
         }
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        Py::new(
+            slf.py(),
+            Self {
+                name: slf.name.clone(),
+                organism: slf.organism.clone(),
+            },
+        )
+    }
 }
 
 impl Temporary for gb_io::seq::Source {
@@ -455,16 +507,31 @@ impl Feature {
         let py = slf.py();
         let kind = slf.kind.to_shared(py)?;
         let location = slf.location.to_shared(py)?;
-        let qualifiers = slf.qualifiers.to_shared(py)?;
-        if qualifiers.bind(py).is_empty() {
+        // avoid creating `Qualifier` objects only to find the list is empty
+        let empty = match &slf.qualifiers {
+            Coa::Owned(qualifiers) => qualifiers.is_empty(),
+            Coa::Shared(qualifiers) => qualifiers.bind(py).is_empty(),
+        };
+        if empty {
             PyString::new(py, "Feature(kind={!r}, location={!r})")
                 .call_method1("format", (kind, location))
         } else {
+            let qualifiers = slf.qualifiers.to_shared(py)?;
             PyString::new(py, "Feature(kind={!r}, location={!r}, qualifiers={!r})")
                 .call_method1("format", (kind, location, qualifiers))
         }
     }
 
+    fn __copy__<'py>(mut slf: PyRefMut<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        let feature = slf.deref_mut();
+        // convert attributes so they are shared with the copy
+        feature.kind.to_shared(py)?;
+        feature.location.to_shared(py)?;
+        feature.qualifiers.to_shared(py)?;
+        Py::new(py, feature.clone())
+    }
+
     /// `str`: The kind of feature.
     #[getter]
     fn get_kind<'py>(mut slf: PyRefMut<'py, Self>) -> PyResult<Py<PyString>> {
@@ -575,6 +642,18 @@ impl Qualifier {
         }
     }
 
+    fn __copy__<'py>(mut slf: PyRefMut<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        let key = slf.key.to_shared(py)?;
+        Py::new(
+            py,
+            Self {
+                key: Coa::Shared(key),
+                value: slf.value.clone(),
+            },
+        )
+    }
+
     /// `str`: The qualifier key.
     #[getter]
     fn get_key<'py>(mut slf: PyRefMut<'py, Self>) -> PyResult<Py<PyString>> {
@@ -632,6 +711,41 @@ pub enum Strand {
     Reverse,
 }
 
+impl Strand {
+    /// Get the opposite strand.
+    fn reverse(self) -> Self {
+        match self {
+            Strand::Direct => Strand::Reverse,
+            Strand::Reverse => Strand::Direct,
+        }
+    }
+
+    /// Get the strand of a `Location` object.
+    ///
+    /// Nested `Complement` and leaf locations are handled natively, and the
+    /// `strand` attribute is only looked up for other location types.
+    fn from_location(location: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let py = location.py();
+        let mut location = location.clone();
+        let mut reverse = false;
+        while let Ok(complement) = location.downcast::<Complement>() {
+            let inner = complement.borrow().location.bind(py).clone().into_any();
+            location = inner;
+            reverse = !reverse;
+        }
+        let strand = if location.is_instance_of::<Range>() || location.is_instance_of::<Between>() {
+            Strand::Direct
+        } else {
+            location.getattr("strand")?.extract()?
+        };
+        if reverse {
+            Ok(strand.reverse())
+        } else {
+            Ok(strand)
+        }
+    }
+}
+
 impl<'py> FromPyObject<'py> for Strand {
     fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
         let py = ob.py();
@@ -669,62 +783,51 @@ impl<'py> IntoPyObject<'py> for Strand {
 #[derive(Debug)]
 pub struct Location;
 
+/// Create a new instance of a `Location` subclass, as a `Location` object.
+fn new_location<T: PyClass>(
+    py: Python,
+    init: impl Into<PyClassInitializer<T>>,
+) -> PyResult<Py<Location>> {
+    Ok(Bound::new(py, init)?
+        .into_any()
+        .downcast_into::<Location>()?
+        .unbind())
+}
+
 impl Convert for gb_io::seq::Location {
     type Output = Location;
     fn convert_with(self, py: Python, interner: &mut PyInterner) -> PyResult<Py<Self::Output>> {
         macro_rules! convert_vec {
             ($ty:ident, $inner:expr) => {{
-                let objects: PyObject = $inner
+                let objects = $inner
                     .into_iter()
                     .map(|loc| loc.convert_with(py, interner))
-                    .collect::<PyResult<Vec<Py<Location>>>>()
-                    .map(|objects| PyList::new(py, objects))
-                    .and_then(|list| list?.into_py_any(py)?.extract(py))?;
-                Join::__new__(py, objects)
-                    .and_then(|x| Py::new(py, x))
-                    .and_then(|x| match x.into_py_any(py)?.extract::<Py<Location>>(py) {
-                        Ok(pyref) => Ok(pyref.clone_ref(py)),
-                        Err(e) => Err(PyErr::from(e)),
-                    })
+                    .collect::<PyResult<Vec<Py<Location>>>>()?;
+                // items are known to be locations, no need to check them again
+                let locations = PyList::new(py, objects)?.unbind();
+                new_location(
+                    py,
+                    PyClassInitializer::from(Location).add_subclass($ty { locations }),
+                )
             }};
         }
 
         match self {
             SeqLocation::Range((start, Before(before)), (end, After(after))) => {
-                Py::new(py, Range::__new__(start, end, before, after)).and_then(|x| {
-                    match x.into_py_any(py)?.extract::<Py<Location>>(py) {
-                        Ok(pyref) => Ok(pyref.clone_ref(py)),
-                        Err(e) => Err(PyErr::from(e)),
-                    }
-                })
+                new_location(py, Range::__new__(start, end, before, after))
             }
-            SeqLocation::Between(start, end) => {
-                Py::new(py, Between::__new__(start, end)).and_then(|x| {
-                    match x.into_py_any(py)?.extract::<Py<Location>>(py) {
-                        Ok(pyref) => Ok(pyref.clone_ref(py)),
-                        Err(e) => Err(PyErr::from(e)),
-                    }
-                })
+            SeqLocation::Between(start, end) => new_location(py, Between::__new__(start, end)),
+            SeqLocation::Complement(inner_location) => {
+                let inner = (*inner_location).convert_with(py, interner)?;
+                new_location(py, Complement::__new__(inner))
             }
-            SeqLocation::Complement(inner_location) => (*inner_location)
-                .convert_with(py, interner)
-                .and_then(|inner| Py::new(py, Complement::__new__(inner)))
-                .and_then(|x| match x.into_py_any(py)?.extract::<Py<Location>>(py) {
-                    Ok(pyref) => Ok(pyref.clone_ref(py)),
-                    Err(e) => Err(PyErr::from(e)),
-                }),
             SeqLocation::Join(inner_locations) => convert_vec!(Join, inner_locations),
             SeqLocation::Order(inner_locations) => convert_vec!(Order, inner_locations),
             SeqLocation::Bond(inner_locations) => convert_vec!(Bond, inner_locations),
             SeqLocation::OneOf(inner_locations) => convert_vec!(OneOf, inner_locations),
             SeqLocation::External(accession, location) => {
                 let loc = location.map(|x| x.convert_with(py, interner)).transpose()?;
-                Py::new(py, External::__new__(accession, loc)).and_then(|x| {
-                    match x.into_py_any(py)?.extract::<Py<Location>>(py) {
-                        Ok(pyref) => Ok(pyref.clone_ref(py)),
-                        Err(e) => Err(PyErr::from(e)),
-                    }
-                })
+                new_location(py, External::__new__(accession, loc))
             }
             _ => Err(PyNotImplementedError::new_err(format!(
                 "conversion of {:?}",
@@ -737,31 +840,31 @@ impl Convert for gb_io::seq::Location {
 impl Extract for gb_io::seq::Location {
     fn extract(py: Python, object: Py<Location>) -> PyResult<Self> {
         let location = object.bind(py);
-        if let Ok(range) = location.extract::<Bound<Range>>() {
+        if let Ok(range) = location.downcast::<Range>() {
             let range = range.borrow();
             Ok(SeqLocation::Range(
                 (range.start, gb_io::seq::Before(range.before)),
                 (range.end, gb_io::seq::After(range.after)),
             ))
-        } else if let Ok(between) = location.extract::<Bound<Between>>() {
+        } else if let Ok(between) = location.downcast::<Between>() {
             let between = between.borrow();
             Ok(SeqLocation::Between(between.start, between.end))
-        } else if let Ok(complement) = location.extract::<Bound<Complement>>() {
+        } else if let Ok(complement) = location.downcast::<Complement>() {
             let location = Extract::extract(py, complement.borrow().location.clone_ref(py))?;
             Ok(SeqLocation::Complement(Box::new(location)))
-        } else if let Ok(join) = location.extract::<Bound<Join>>() {
+        } else if let Ok(join) = location.downcast::<Join>() {
             let locations = Extract::extract(py, join.borrow().locations.clone_ref(py))?;
             Ok(SeqLocation::Join(locations))
-        } else if let Ok(order) = location.extract::<Bound<Order>>() {
+        } else if let Ok(order) = location.downcast::<Order>() {
             let locations = Extract::extract(py, order.borrow().locations.clone_ref(py))?;
             Ok(SeqLocation::Order(locations))
-        } else if let Ok(bond) = location.extract::<Bound<Bond>>() {
+        } else if let Ok(bond) = location.downcast::<Bond>() {
             let locations = Extract::extract(py, bond.borrow().locations.clone_ref(py))?;
             Ok(SeqLocation::Bond(locations))
-        } else if let Ok(one_of) = location.extract::<Bound<OneOf>>() {
+        } else if let Ok(one_of) = location.downcast::<OneOf>() {
             let locations = Extract::extract(py, one_of.borrow().locations.clone_ref(py))?;
             Ok(SeqLocation::OneOf(locations))
-        } else if let Ok(external) = location.extract::<Bound<External>>() {
+        } else if let Ok(external) = location.downcast::<External>() {
             let external = external.borrow();
             let location = external
                 .location
@@ -834,6 +937,13 @@ impl Range {
         }
     }
 
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        Py::new(
+            slf.py(),
+            Self::__new__(slf.start, slf.end, slf.before, slf.after),
+        )
+    }
+
     #[getter]
     fn get_strand<'py>(slf: PyRef<'py, Self>) -> Bound<'py, PyString> {
         Strand::Direct.into_pyobject(slf.py()).unwrap()
@@ -866,6 +976,10 @@ impl Between {
         format!("Between({}, {})", self.start, self.end)
     }
 
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        Py::new(slf.py(), Self::__new__(slf.start, slf.end))
+    }
+
     #[getter]
     fn get_strand<'py>(slf: PyRef<'py, Self>) -> Bound<'py, PyString> {
         Strand::Direct.into_pyobject(slf.py()).unwrap()
@@ -894,6 +1008,11 @@ impl Complement {
             .call_method1("format", (Py::clone_ref(&slf.location, py),))
     }
 
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        Py::new(py, Self::__new__(slf.location.clone_ref(py)))
+    }
+
     #[getter]
     fn get_start<'py>(slf: PyRef<'py, Self>) -> PyResult<i32> {
         let py = slf.py();
@@ -913,16 +1032,10 @@ impl Complement {
     #[getter]
     fn get_strand<'py>(slf: PyRef<'py, Self>) -> PyResult<Bound<'py, PyString>> {
         let py = slf.py();
-        match slf
-            .location
-            .getattr(py, "strand")
-            .and_then(|start| start.extract(py))?
-        {
-            Strand::Direct => Strand::Reverse
-                .into_pyobject(py)
-                .map_err(|_| unreachable!()),
-            Strand::Reverse => Strand::Direct.into_pyobject(py).map_err(|_| unreachable!()),
-        }
+        Strand::from_location(slf.location.bind(py).as_any())?
+            .reverse()
+            .into_pyobject(py)
+            .map_err(|_| unreachable!())
     }
 }
 
@@ -955,6 +1068,16 @@ impl Join {
         PyString::new(py, "Join({!r})").call_method1("format", (&slf.locations,))
     }
 
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        Py::new(
+            py,
+            PyClassInitializer::from(Location).add_subclass(Self {
+                locations: slf.locations.clone_ref(py),
+            }),
+        )
+    }
+
     #[getter]
     fn get_start<'py>(slf: PyRef<'py, Self>) -> PyResult<i32> {
         let py = slf.py();
@@ -1016,6 +1139,16 @@ impl Order {
         let py = slf.py();
         PyString::new(py, "Order({!r})").call_method1("format", (&slf.locations,))
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        Py::new(
+            py,
+            PyClassInitializer::from(Location).add_subclass(Self {
+                locations: slf.locations.clone_ref(py),
+            }),
+        )
+    }
 }
 
 /// A location for a `Feature` corresponding to a bond between locations.
@@ -1045,6 +1178,16 @@ impl Bond {
         let py = slf.py();
         PyString::new(py, "Bond({!r})").call_method1("format", (&slf.locations,))
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        Py::new(
+            py,
+            PyClassInitializer::from(Location).add_subclass(Self {
+                locations: slf.locations.clone_ref(py),
+            }),
+        )
+    }
 }
 
 /// A location for a `Feature` located at one of the given locations.
@@ -1075,6 +1218,16 @@ impl OneOf {
         let py = slf.py();
         PyString::new(py, "OneOf({!r})").call_method1("format", (&slf.locations,))
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        Py::new(
+            py,
+            PyClassInitializer::from(Location).add_subclass(Self {
+                locations: slf.locations.clone_ref(py),
+            }),
+        )
+    }
 }
 
 /// A location for a `Feature` located in an external record.
@@ -1108,6 +1261,12 @@ impl External {
             None => PyString::new(py, "External({!r})").call_method1("format", (&slf.accession,)),
         }
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        let py = slf.py();
+        let location = slf.location.as_ref().map(|loc| loc.clone_ref(py));
+        Py::new(py, Self::__new__(slf.accession.clone(), location))
+    }
 }
 
 // ---------------------------------------------------------------------------
@@ -1161,6 +1320,21 @@ impl Reference {
             remark,
         })
     }
+
+    fn __copy__<'py>(slf: PyRef<'py, Self>) -> PyResult<Py<Self>> {
+        Py::new(
+            slf.py(),
+            Self::__new__(
+                slf.title.clone(),
+                slf.description.clone(),
+                slf.authors.clone(),
+                slf.consortium.clone(),
+                slf.journal.clone(),
+                slf.pubmed.clone(),
+                slf.remark.clone(),
+            ),
+        )
+    }
 }
 
 impl Convert for gb_io::seq::Reference {
@@ -1198,6 +1372,56 @@ impl Extract for gb_io::seq::Reference {
 
 // ---------------------------------------------------------------------------
 
+/// The maximum capacity of the scratch buffer kept between calls to `dump`.
+const SCRATCH_CAPACITY: usize = 1 << 22;
+
+thread_local! {
+    /// A scratch buffer used by `dump` to format records before writing them.
+    static SCRATCH: Cell<Vec<u8>> = const { Cell::new(Vec::new()) };
+}
+
+/// Convert an error from the GenBank parser into a Python exception.
+fn convert_parser_error(py: Python, error: GbParserError) -> PyErr {
+    match error {
+        GbParserError::Io(e) => match e.raw_os_error() {
+            Some(code) => PyOSError::new_err((code, e.to_string())),
+            None => match PyErr::take(py) {
+                Some(e) => e,
+                None => PyOSError::new_err(e.to_string()),
+            },
+        },
+        GbParserError::SyntaxError(e) => {
+            let msg = format!("parser failed: {}", e);
+            PyValueError::new_err(msg)
+        }
+    }
+}
+
+/// Get the size of the regular file behind a Python file-handle, if any.
+///
+/// Streams that are not backed by a file descriptor, or backed by a pipe
+/// or a socket, return `None` so they can be read incrementally.
+fn regular_file_size(file: &Bound<PyAny>) -> Option<usize> {
+    let py = file.py();
+    let fd = file.call_method0("fileno").ok()?;
+    let stat = py.import("os").ok()?.call_method1("fstat", (fd,)).ok()?;
+    let mode = stat.getattr("st_mode").ok()?;
+    let regular = py
+        .import("stat")
+        .ok()?
+        .call_method1("S_ISREG", (mode,))
+        .ok()?
+        .extract::<bool>()
+        .ok()?;
+    if regular {
+        stat.getattr("st_size").ok()?.extract::<usize>().ok()
+    } else {
+        None
+    }
+}
+
+// ---------------------------------------------------------------------------
+
 /// A fast GenBank I/O library based on the ``gb-io`` Rust crate.
 ///
 /// Example:
@@ -1261,28 +1485,23 @@ pub fn init(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     #[pyo3(name = "load", text_signature = "(fh)")]
     fn load(py: Python, fh: &Bound<PyAny>) -> PyResult<Py<PyList>> {
         // extract either a path or a file-handle from the arguments
-        // let path: Option<String>;
-        let stream: Box<dyn Read> = if let Ok(s) = fh.downcast::<PyString>() {
-            // get a buffered reader to the resources pointed by `path`
-            let bf = match std::fs::File::open(s.to_str()?) {
-                Ok(f) => f,
+        let (mut handle, size_hint) = if let Ok(s) = fh.downcast::<PyString>() {
+            // get a memory-mapped reader to the resources pointed by `path`
+            match Handle::try_from(PathBuf::from(s.to_str()?)) {
+                Ok(h) => (h, None),
                 Err(e) => {
                     return match e.raw_os_error() {
                         Some(code) => Err(PyOSError::new_err((code, e.to_string()))),
                         None => Err(PyOSError::new_err(e.to_string())),
                     }
                 }
-            };
-            // store the path for later
-            // path = Some(s.to_str()?.to_string());
-            // send the file reader to the heap.
-            Box::new(bf)
+            }
         } else {
-            // get a buffered reader by wrapping the given file handle
-            let bf = match PyFileRead::from_ref(fh.clone()) {
+            // get a reader by wrapping the given file handle
+            match PyFileGILRead::from_ref(fh.clone()) {
                 // Object is a binary file-handle: attempt to parse the
                 // document and return an `OboDoc` object.
-                Ok(f) => f,
+                Ok(f) => (Handle::PyFile(f), regular_file_size(fh)),
                 // Object is not a binary file-handle: wrap the inner error
                 // into a `TypeError` and raise that error.
                 Err(e) => {
@@ -1290,40 +1509,30 @@ pub fn init(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
                     err.set_cause(py, Some(e));
                     return Err(err);
                 }
-            };
-            // send the Python file-handle reference to the heap.
-            Box::new(bf)
+            }
         };
 
-        // create the reader
-        let reader = SeqReader::new(stream);
-
-        // parse all records
-        let mut interner = PyInterner::default();
-        let records = PyList::empty(py);
-        for result in reader {
-            match result {
-                Ok(seq) => {
-                    records.append(Py::new(py, seq.convert_with(py, &mut interner)?)?)?;
-                }
-                Err(GbParserError::Io(e)) => {
-                    return match e.raw_os_error() {
-                        Some(code) => Err(PyOSError::new_err((code, e.to_string()))),
-                        None => match PyErr::take(py) {
-                            Some(e) => Err(e),
-                            None => Err(PyOSError::new_err(e.to_string())),
-                        },
-                    };
-                }
-                Err(GbParserError::SyntaxError(e)) => {
-                    let msg = format!("parser failed: {}", e);
-                    return Err(PyValueError::new_err(msg));
-                }
-            }
-        }
+        // parse all records without holding the GIL, the Python file-handle
+        // wrapper acquires it again only when calling the Python methods
+        let result = if let Some(data) = handle.as_slice() {
+            // the file could be mapped, parse all records in parallel
+            py.allow_threads(|| parse_slice(data))
+        } else if let Some(size) = size_hint {
+            // the handle is backed by a regular file, read it entirely in
+            // a pre-sized buffer and parse it like a memory-mapped file
+            py.allow_threads(|| {
+                let mut data = Vec::with_capacity(size);
+                handle.read_to_end(&mut data).map_err(GbParserError::Io)?;
+                parse_slice(&data)
+            })
+        } else {
+            // stream the records from the reader
+            py.allow_threads(|| SeqReader::new(handle).collect::<Result<Vec<_>, _>>())
+        };
+        let seqs = result.map_err(|e| convert_parser_error(py, e))?;
 
-        // return records
-        Ok(records.unbind())
+        // convert records to Python objects in a pre-sized list
+        seqs.convert_with(py, &mut PyInterner::default())
     }
 
     /// Iterate over the GenBank records in the given file or file handle.
@@ -1372,43 +1581,6 @@ pub fn init(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
         escape_locus: bool,
         truncate_locus: bool,
     ) -> PyResult<()> {
-        // extract either a path or a file-handle from the arguments
-        let stream: Box<dyn Write> = if let Ok(s) = fh.downcast::<PyString>() {
-            // get a buffered reader to the resources pointed by `path`
-            let bf = match std::fs::File::create(s.to_str()?) {
-                Ok(f) => f,
-                Err(e) => {
-                    return match e.raw_os_error() {
-                        Some(code) => Err(PyOSError::new_err((code, e.to_string()))),
-                        None => Err(PyOSError::new_err(e.to_string())),
-                    }
-                }
-            };
-            // send the file reader to the heap.
-            Box::new(bf)
-        } else {
-            // get a buffered writer by wrapping the file handle
-            let bf = match PyFileWrite::from_ref(fh) {
-                // Object is a binary file-handle: attempt to parse the
-                // document and return an `OboDoc` object.
-                Ok(f) => f,
-                // Object is not a binary file-handle: wrap the inner error
-                // into a `TypeError` and raise that error.
-                Err(e) => {
-                    let err = PyTypeError::new_err("expected path or binary file handle");
-                    err.set_cause(py, Some(e));
-                    return Err(err);
-                }
-            };
-            // send the Python file-handle reference to the heap.
-            Box::new(bf)
-        };
-
-        // create the writer
-        let mut writer = SeqWriter::new(stream);
-        writer.truncate_locus(truncate_locus);
-        writer.escape_locus(escape_locus);
-
         // if a single record was given, wrap it in an iterable
         let it = if let Ok(record) = records.extract::<Bound<'_, Record>>() {
             PyIterator::from_object(&PyTuple::new(py, [record])?.into_py_any(py)?.bind(py))?
@@ -1416,19 +1588,89 @@ pub fn init(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
             PyIterator::from_object(&records)?
         };
 
-        // write sequences
-        for result in it {
-            // make sure we received a Record object
-            let record = result?.extract::<Py<Record>>()?;
-            let seq = Extract::extract(py, record)?;
-            // write the seq
-            writer.write(&seq).map_err(|err| match err.raw_os_error() {
+        // if given a path, write to the file directly without the GIL
+        if let Ok(s) = fh.downcast::<PyString>() {
+            // get a buffered writer to the resources pointed by `path`
+            let mut stream = match std::fs::File::create(s.to_str()?) {
+                Ok(f) => BufWriter::with_capacity(1 << 20, f),
+                Err(e) => {
+                    return match e.raw_os_error() {
+                        Some(code) => Err(PyOSError::new_err((code, e.to_string()))),
+                        None => Err(PyOSError::new_err(e.to_string())),
+                    }
+                }
+            };
+            // write sequences
+            for result in it {
+                // make sure we received a Record object
+                let record = result?.extract::<Py<Record>>()?;
+                let seq = Extract::extract(py, record)?;
+                // write the seq
+                py.allow_threads(|| {
+                    let mut writer = SeqWriter::new(&mut stream);
+                    writer.truncate_locus(truncate_locus);
+                    writer.escape_locus(escape_locus);
+                    writer.write(&seq)
+                })
+                .map_err(|err| match err.raw_os_error() {
+                    Some(code) => PyIOError::new_err((code, err.to_string())),
+                    None => PyIOError::new_err(err.to_string()),
+                })?;
+            }
+            // flush remaining data to the file
+            return stream.flush().map_err(|err| match err.raw_os_error() {
                 Some(code) => PyIOError::new_err((code, err.to_string())),
                 None => PyIOError::new_err(err.to_string()),
-            })?;
+            });
         }
 
-        Ok(())
+        // get a writer by wrapping the file handle
+        let mut stream = match PyFileWrite::from_ref(fh) {
+            // Object is a binary file-handle: attempt to parse the
+            // document and return an `OboDoc` object.
+            Ok(f) => f,
+            // Object is not a binary file-handle: wrap the inner error
+            // into a `TypeError` and raise that error.
+            Err(e) => {
+                let err = PyTypeError::new_err("expected path or binary file handle");
+                err.set_cause(py, Some(e));
+                return Err(err);
+            }
+        };
+
+        // write sequences, formatting each record into a scratch buffer
+        // first so that the stream receives a single `write` call per record
+        let mut buffer = SCRATCH.take();
+        let result = (|| -> PyResult<()> {
+            for result in it {
+                // make sure we received a Record object
+                let record = result?.extract::<Py<Record>>()?;
+                let seq = Extract::extract(py, record)?;
+                // format the seq without the GIL
+                buffer.clear();
+                let result = py.allow_threads(|| {
+                    let mut writer = SeqWriter::new(&mut buffer);
+                    writer.truncate_locus(truncate_locus);
+                    writer.escape_locus(escape_locus);
+                    writer.write(&seq)
+                });
+                // write the formatted record with the GIL
+                result
+                    .and_then(|_| stream.write_all(&buffer))
+                    .map_err(|err| match err.raw_os_error() {
+                        Some(code) => PyIOError::new_err((code, err.to_string())),
+                        None => PyIOError::new_err(err.to_string()),
+                    })?;
+            }
+            Ok(())
+        })();
+
+        // give back the scratch buffer for the next call
+        buffer.clear();
+        buffer.shrink_to(SCRATCH_CAPACITY);
+        SCRATCH.set(buffer);
+
+        result
     }
 
     Ok(())
@@ -36,41 +36,6 @@ macro_rules! transmute_file_error {
 
 // -----------------------------------------------------------------------------
 
-/// A wrapper around a readable Python file borrowed within a GIL lifetime.
-#[derive(Debug, Clone)]
-pub enum PyFileRead<'p> {
-    Binary(PyFileReadBin<'p>),
-    Text(PyFileReadText<'p>),
-}
-
-impl<'p> PyFileRead<'p> {
-    pub fn from_ref(file: Bound<'p, PyAny>) -> PyResult<Self> {
-        let res = file.call_method1("read", (0,))?;
-        if res.downcast::<PyBytes>().is_ok() {
-            PyFileReadBin::new(file).map(Self::Binary)
-        } else if res.downcast::<PyString>().is_ok() {
-            PyFileReadText::new(file).map(Self::Text)
-        } else {
-            let ty = res.get_type().name()?.to_string();
-            Err(PyTypeError::new_err(format!(
-                "expected bytes or str, found {}",
-                ty
-            )))
-        }
-    }
-}
-
-impl<'p> Read for PyFileRead<'p> {
-    fn read(&mut self, buf: &mut [u8]) -> Result<usize, IoError> {
-        match self {
-            PyFileRead::Binary(readbin) => readbin.read(buf),
-            PyFileRead::Text(readtext) => readtext.read(buf),
-        }
-    }
-}
-
-// ---------------------------------------------------------------------------
-
 #[derive(Debug, Clone)]
 pub struct PyFileReadBin<'p> {
     file: Bound<'p, PyAny>,
@@ -183,11 +148,14 @@ impl<'p> PyFileReadText<'p> {
 impl<'p> Read for PyFileReadText<'p> {
     fn read(&mut self, mut buf: &mut [u8]) -> Result<usize, IoError> {
         // number of bytes returned
-        let mut n = self.buffer.len();
-        // copy buffer data from previous call
-        buf[..n].copy_from_slice(&self.buffer);
+        let mut n = self.buffer.len().min(buf.len());
+        // copy buffer data from previous call, as much as it fits
+        buf[..n].copy_from_slice(&self.buffer[..n]);
+        self.buffer.drain(..n);
+        if !self.buffer.is_empty() {
+            return Ok(n);
+        }
         buf = &mut buf[n..];
-        self.buffer.clear();
         // read next chunk
         match self.file.call_method1("read", (buf.len(),)) {
             Ok(obj) => {
@@ -459,8 +427,19 @@ impl<'p> Write for PyFileWriteText<'p> {
         let s = PyString::new(self.file.py(), decoded);
         match self.file.call_method1("write", (s,)) {
             Ok(obj) => {
-                if let Ok(len) = obj.extract() {
-                    Ok(decoded[..len].as_bytes().len())
+                if let Ok(len) = obj.extract::<usize>() {
+                    // a string has as many characters as bytes only when
+                    // it is ASCII and was written entirely
+                    if len == decoded.len() {
+                        Ok(len)
+                    } else {
+                        // convert the number of characters into a number of bytes
+                        Ok(decoded
+                            .char_indices()
+                            .nth(len)
+                            .map(|(i, _)| i)
+                            .unwrap_or(decoded.len()))
+                    }
                 } else {
                     let ty = obj.get_type().name()?.to_string();
                     let msg = format!("expected int, found {}", ty);
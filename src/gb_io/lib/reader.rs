@@ -1,11 +1,19 @@
 use std::fs::File;
+use std::io::Cursor;
 use std::io::Error as IoError;
 use std::io::Read;
 use std::ops::DerefMut;
 use std::path::Path;
 use std::path::PathBuf;
+use std::sync::atomic::AtomicUsize;
+use std::sync::atomic::Ordering;
+use std::sync::OnceLock;
 
+use gb_io::reader::GbParserError;
 use gb_io::reader::SeqReader;
+use gb_io::seq::Seq;
+use memchr::memmem::Finder;
+use memmap2::Mmap;
 
 use pyo3::exceptions::PyOSError;
 use pyo3::exceptions::PyRuntimeError;
@@ -21,13 +29,39 @@ use super::Record;
 /// An enum providing `Read` for either Python file-handles or filesystem files.
 pub enum Handle {
     FsFile(File, PathBuf),
+    MmapFile(Cursor<Mmap>, PathBuf),
     PyFile(PyFileGILRead),
 }
 
+impl Handle {
+    /// Get the contents of the handle as a byte slice, if memory-mapped.
+    pub fn as_slice(&self) -> Option<&[u8]> {
+        match self {
+            Handle::MmapFile(cursor, _) => Some(cursor.get_ref().as_ref()),
+            _ => None,
+        }
+    }
+}
+
 impl TryFrom<PathBuf> for Handle {
     type Error = std::io::Error;
     fn try_from(p: PathBuf) -> Result<Self, Self::Error> {
         let file = File::open(&p)?;
+        // only map non-empty regular files: special files (e.g. in procfs)
+        // report a length of zero and must be read to get their contents,
+        // and directories should report errors from the `read` calls.
+        let metadata = file.metadata()?;
+        if metadata.is_file() && metadata.len() > 0 {
+            // SAFETY: the map is only ever read from, but the file could
+            //         still be truncated by another process while mapped,
+            //         which is the usual caveat of memory-mapped I/O.
+            if let Ok(mmap) = unsafe { Mmap::map(&file) } {
+                // records are read front to back, let the kernel prefetch
+                #[cfg(unix)]
+                let _ = mmap.advise(memmap2::Advice::Sequential);
+                return Ok(Handle::MmapFile(Cursor::new(mmap), p));
+            }
+        }
         Ok(Handle::FsFile(file, p))
     }
 }
@@ -36,6 +70,7 @@ impl Read for Handle {
     fn read(&mut self, buf: &mut [u8]) -> Result<usize, IoError> {
         match self {
             Handle::FsFile(f, _) => f.read(buf),
+            Handle::MmapFile(f, _) => f.read(buf),
             Handle::PyFile(f) => f.read(buf),
         }
     }
@@ -43,6 +78,127 @@ impl Read for Handle {
 
 // ---------------------------------------------------------------------------
 
+/// A searcher for the start of a record terminator line.
+static TERMINATOR: OnceLock<Finder<'static>> = OnceLock::new();
+
+/// Split a buffer into chunks containing a single GenBank record each.
+///
+/// Records are terminated by a line starting with `//`, which cannot
+/// appear anywhere else in a record since all other lines start with
+/// either a keyword or whitespace.
+fn split_records(data: &[u8]) -> Vec<&[u8]> {
+    let finder = TERMINATOR.get_or_init(|| Finder::new(b"\n//"));
+    let mut chunks = Vec::new();
+    let mut start = 0;
+    while let Some(i) = finder.find(&data[start..]) {
+        let line = start + i + 1;
+        let end = match memchr::memchr(b'\n', &data[line..]) {
+            Some(j) => line + j + 1,
+            None => data.len(),
+        };
+        chunks.push(&data[start..end]);
+        start = end;
+    }
+    if !data[start..].iter().all(u8::is_ascii_whitespace) {
+        chunks.push(&data[start..]);
+    }
+    chunks
+}
+
+/// Parse the GenBank records of consecutive chunks.
+fn parse_chunks(chunks: &[&[u8]]) -> Result<Vec<Seq>, GbParserError> {
+    let mut seqs = Vec::with_capacity(chunks.len());
+    for chunk in chunks {
+        for result in SeqReader::new(*chunk) {
+            seqs.push(result?);
+        }
+    }
+    Ok(seqs)
+}
+
+/// The minimum amount of data worth parsing on a separate thread.
+const THREAD_MIN_BYTES: usize = 4 << 20;
+
+/// The number of threads currently spawned by `parse_slice` calls.
+static SPAWNED: AtomicUsize = AtomicUsize::new(0);
+
+/// A number of threads reserved from the `SPAWNED` budget, released on drop.
+struct Workers(usize);
+
+impl Workers {
+    /// Reserve up to `wanted` threads while keeping `SPAWNED` under `max`.
+    fn reserve(wanted: usize, max: usize) -> Self {
+        let available = |spawned: usize| wanted.min(max.saturating_sub(spawned));
+        let spawned = SPAWNED
+            .fetch_update(Ordering::AcqRel, Ordering::Acquire, |n| {
+                Some(n + available(n))
+            })
+            .unwrap();
+        Self(available(spawned))
+    }
+}
+
+impl Drop for Workers {
+    fn drop(&mut self) {
+        SPAWNED.fetch_sub(self.0, Ordering::AcqRel);
+    }
+}
+
+/// Parse all the GenBank records in a buffer, in parallel.
+///
+/// Records are split into contiguous groups, so that results can be joined
+/// back in file order and the first error encountered in the file is the
+/// one returned. Small buffers are parsed on the calling thread, and the
+/// number of spawned threads is bounded by the available parallelism
+/// across all concurrent calls, so that calling `load` from a thread pool
+/// does not oversubscribe the machine.
+pub fn parse_slice(data: &[u8]) -> Result<Vec<Seq>, GbParserError> {
+    let chunks = split_records(data);
+    let cores = std::thread::available_parallelism()
+        .map(usize::from)
+        .unwrap_or(1);
+    let wanted = (data.len() / THREAD_MIN_BYTES)
+        .min(cores)
+        .min(chunks.len())
+        .saturating_sub(1);
+    if wanted == 0 {
+        return parse_chunks(&chunks);
+    }
+
+    // the calling thread parses the first group itself
+    let workers = Workers::reserve(wanted, cores);
+    let threads = workers.0 + 1;
+    if threads == 1 {
+        return parse_chunks(&chunks);
+    }
+
+    let size = (chunks.len() + threads - 1) / threads;
+    let results = std::thread::scope(|scope| {
+        let mut groups = chunks.chunks(size);
+        let first = groups.next().unwrap_or_default();
+        let handles = groups
+            .map(|group| scope.spawn(move || parse_chunks(group)))
+            .collect::<Vec<_>>();
+        let mut results = Vec::with_capacity(threads);
+        results.push(parse_chunks(first));
+        results.extend(handles.into_iter().map(|handle| {
+            handle
+                .join()
+                .unwrap_or_else(|e| std::panic::resume_unwind(e))
+        }));
+        results
+    });
+    drop(workers);
+
+    let mut seqs = Vec::with_capacity(chunks.len());
+    for result in results {
+        seqs.extend(result?);
+    }
+    Ok(seqs)
+}
+
+// ---------------------------------------------------------------------------
+
 /// An iterator over the `~gb_io.Record` contained in a file.
 #[pyclass(module = "gb_io")]
 pub struct RecordReader {
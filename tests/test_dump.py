@@ -73,6 +73,24 @@ class TestDump(unittest.TestCase):
             ]
         )
 
+    def test_python_record_unicode_text_file(self):
+        record = gb_io.Record(
+            sequence=b"ATGC",
+            name="Test sequence",
+            date=datetime.date(2024, 4, 1),
+            features=[
+                gb_io.Feature("CDS", gb_io.Range(0, 3), [gb_io.Qualifier("note", "µ-opioid receptor")]),
+            ]
+        )
+        buffer = io.StringIO()
+        gb_io.dump(record, buffer)
+        expected = io.BytesIO()
+        gb_io.dump(record, expected)
+        self.assertEqual(buffer.getvalue(), expected.getvalue().decode("utf-8"))
+        self.assertIn('                     /note="µ-opioid receptor"\n', buffer.getvalue())
+        self.assertTrue(buffer.getvalue().endswith("//\n"))
+        self.assertFalse(buffer.getvalue().endswith("//\n\n"))
+
 class TestDumpError(unittest.TestCase):
 
     @classmethod
@@ -1,5 +1,8 @@
+import concurrent.futures
 import unittest
 import os
+import shutil
+import tempfile
 
 import gb_io
 
@@ -12,16 +15,125 @@ class TestLoad(unittest.TestCase):
         path = os.path.join(DATA_FOLDER, "AY048670.1.gb")
         with open(path, "rb") as f:
             records = gb_io.load(f)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].accession, "AY048670")
+        self.assertEqual(records[0].sequence, gb_io.load(path)[0].sequence)
 
     def test_load_text_file(self):
         path = os.path.join(DATA_FOLDER, "AY048670.1.gb")
-        with open(path, "rb") as f:
+        with open(path, "r") as f:
+            records = gb_io.load(f)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].accession, "AY048670")
+        self.assertEqual(records[0].sequence, gb_io.load(path)[0].sequence)
+
+    def test_load_text_file_multiple_records(self):
+        path = os.path.join(DATA_FOLDER, "biopython", "cor6_6.gb")
+        with open(path, "r") as f:
             records = gb_io.load(f)
+        expected = gb_io.load(path)
+        self.assertEqual(len(records), 6)
+        for r1, r2 in zip(records, expected):
+            self.assertEqual(r1.name, r2.name)
+            self.assertEqual(r1.sequence, r2.sequence)
+
+    def test_load_text_file_encoding(self):
+        src = os.path.join(DATA_FOLDER, "biopython", "cor6_6.gb")
+        table = str.maketrans("aeiou", "äëïöü")
+        with open(src) as f:
+            lines = [
+                line[:12] + line[12:].translate(table) if line.startswith("  AUTHORS") else line
+                for line in f
+            ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cor6_6.gb")
+            with open(path, "w", encoding="latin-1") as f:
+                f.writelines(lines)
+            with open(path, encoding="latin-1") as f:
+                records = gb_io.load(f)
+        self.assertEqual(len(records), 6)
+        self.assertEqual(records[0].references[0].authors, "Thömäshöw,M.F.")
 
     def test_load_path(self):
         path = os.path.join(DATA_FOLDER, "AY048670.1.gb")
         records = gb_io.load(path)
 
+    def test_load_threads(self):
+        path = os.path.join(DATA_FOLDER, "AY048670.1.gb")
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(gb_io.load, [path] * 8))
+        for records in results:
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0].accession, "AY048670")
+
+
+class TestLoadRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def assertSameRecords(self, path):
+        loaded = gb_io.load(path)
+        iterated = list(gb_io.iter(path))
+        self.assertEqual(len(loaded), len(iterated))
+        for r1, r2 in zip(loaded, iterated):
+            self.assertEqual(r1.name, r2.name)
+            self.assertEqual(r1.sequence, r2.sequence)
+        return loaded
+
+    def test_multiple_records(self):
+        path = os.path.join(DATA_FOLDER, "biopython", "cor6_6.gb")
+        records = self.assertSameRecords(path)
+        self.assertEqual(len(records), 6)
+
+    def test_release_header(self):
+        path = os.path.join(DATA_FOLDER, "biopython", "gbvrl1_start.seq")
+        records = self.assertSameRecords(path)
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0].name, "AB000048")
+
+    def test_no_end_marker(self):
+        path = os.path.join(DATA_FOLDER, "biopython", "no_end_marker.gb")
+        records = self.assertSameRecords(path)
+        self.assertEqual(len(records), 1)
+
+    def test_crlf(self):
+        src = os.path.join(DATA_FOLDER, "biopython", "cor6_6.gb")
+        path = os.path.join(self.tmpdir, "cor6_6.gb")
+        with open(src, "rb") as f:
+            data = f.read().replace(b"\n", b"\r\n")
+        with open(path, "wb") as f:
+            f.write(data)
+        records = self.assertSameRecords(path)
+        self.assertEqual(len(records), 6)
+
+    def test_syntax_error_order(self):
+        src = os.path.join(DATA_FOLDER, "biopython", "cor6_6.gb")
+        with open(src, "rb") as f:
+            records = f.read().split(b"//\n")[:-1]
+        invalid = [b"LOCUS\n", b"LOCUS \n"]
+
+        # record the error raised for each invalid record on its own
+        messages = []
+        for i, chunk in enumerate(invalid):
+            path = os.path.join(self.tmpdir, "invalid{}.gb".format(i))
+            with open(path, "wb") as f:
+                f.write(chunk + b"//\n")
+            with self.assertRaises(ValueError) as ctx:
+                gb_io.load(path)
+            messages.append(str(ctx.exception))
+
+        path = os.path.join(self.tmpdir, "cor6_6.gb")
+        chunks = records[:2] + invalid[:1] + records[2:4] + invalid[1:] + records[4:]
+        with open(path, "wb") as f:
+            f.write(b"".join(chunk + b"//\n" for chunk in chunks))
+        with self.assertRaises(ValueError) as ctx:
+            gb_io.load(path)
+        self.assertEqual(str(ctx.exception), messages[0])
+
 
 class TestLoadError(unittest.TestCase):
 
@@ -1,8 +1,10 @@
+import copy
 import unittest
 import os
 
 import gb_io
 
+DATA_FOLDER = os.path.realpath(os.path.join(__file__, os.path.pardir, "data"))
 
 class TestLocation(unittest.TestCase):
 
@@ -11,4 +13,53 @@ class TestLocation(unittest.TestCase):
         self.assertEqual(location.strand, "+")
 
         location = gb_io.Complement(location)
-        self.assertEqual(location.strand, "-")
\ No newline at end of file
+        self.assertEqual(location.strand, "-")
+
+    def test_strand_nested(self):
+        location = gb_io.Complement(gb_io.Complement(gb_io.Between(1, 2)))
+        self.assertEqual(location.strand, "+")
+
+        location = gb_io.Complement(location)
+        self.assertEqual(location.strand, "-")
+
+
+class TestCopy(unittest.TestCase):
+
+    def test_copy(self):
+        locations = [
+            gb_io.Range(1, 2, before=True),
+            gb_io.Between(1, 2),
+            gb_io.Complement(gb_io.Range(1, 2)),
+            gb_io.Join([gb_io.Range(1, 2), gb_io.Range(4, 5)]),
+            gb_io.Order([gb_io.Range(1, 2), gb_io.Range(4, 5)]),
+            gb_io.Bond([gb_io.Range(1, 2), gb_io.Range(4, 5)]),
+            gb_io.OneOf([gb_io.Range(1, 2), gb_io.Range(4, 5)]),
+            gb_io.External("AY048670", gb_io.Range(1, 2)),
+        ]
+        for location1 in locations:
+            with self.subTest(type=type(location1).__name__):
+                location2 = copy.copy(location1)
+                self.assertIs(type(location1), type(location2))
+                self.assertIsNot(location1, location2)
+                self.assertEqual(repr(location1), repr(location2))
+                if hasattr(location1, "locations"):
+                    self.assertIs(location1.locations, location2.locations)
+                elif hasattr(location1, "location"):
+                    self.assertIs(location1.location, location2.location)
+
+
+class TestLoad(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.join(DATA_FOLDER, "biopython", "1MRR_A.gp")
+        self.record = gb_io.load(path)[0]
+
+    def test_order(self):
+        site = next(f for f in self.record.features if f.kind == "Site")
+        self.assertIsInstance(site.location, gb_io.Order)
+
+    def test_bond(self):
+        het = next(f for f in self.record.features if f.kind == "Het")
+        self.assertIsInstance(het.location, gb_io.Join)
+        for location in het.location.locations:
+            self.assertIsInstance(location, gb_io.Bond)
@@ -0,0 +1,83 @@
+import copy
+import unittest
+import os
+
+import gb_io
+
+DATA_FOLDER = os.path.realpath(os.path.join(__file__, os.path.pardir, "data"))
+
+
+class TestRecord(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(DATA_FOLDER, "AY048670.1.gb")
+        cls.records = gb_io.load(path)
+
+    def test_sequence_shared(self):
+        record = self.records[0]
+        self.assertIs(record.sequence, record.sequence)
+
+    def test_sequence_buffer(self):
+        record = gb_io.Record(sequence=b"ATGC")
+        view = memoryview(record.sequence)
+        self.assertEqual(view.format, "B")
+        self.assertEqual(view.nbytes, 4)
+        view[0] = ord("T")
+        self.assertEqual(record.sequence, bytearray(b"TTGC"))
+
+    def test_feature_kind_shared(self):
+        features = self.records[0].features
+        self.assertEqual(features[1].kind, "CDS")
+        self.assertIs(features[1].kind, features[2].kind)
+
+    def test_qualifier_key_shared(self):
+        features = self.records[0].features
+        q1 = features[1].qualifiers[0]
+        q2 = features[2].qualifiers[0]
+        self.assertEqual(q1.key, "note")
+        self.assertIs(q1.key, q2.key)
+
+    def test_features_shared(self):
+        record = self.records[0]
+        self.assertIs(record.features, record.features)
+        self.assertIs(record.features[0], record.features[0])
+
+    def test_copy(self):
+        record1 = self.records[0]
+        record2 = copy.copy(record1)
+        self.assertIsNot(record1, record2)
+        self.assertEqual(record1.name, record2.name)
+        self.assertIs(record1.features, record2.features)
+        self.assertIs(record1.references, record2.references)
+        self.assertIs(record1.sequence, record2.sequence)
+
+    def test_copy_feature(self):
+        feature1 = self.records[0].features[1]
+        feature2 = copy.copy(feature1)
+        self.assertIsNot(feature1, feature2)
+        self.assertIs(feature1.kind, feature2.kind)
+        self.assertIs(feature1.location, feature2.location)
+        self.assertIs(feature1.qualifiers, feature2.qualifiers)
+
+    def test_copy_qualifier(self):
+        qualifier1 = gb_io.Qualifier("note", "test")
+        qualifier2 = copy.copy(qualifier1)
+        self.assertIsNot(qualifier1, qualifier2)
+        self.assertIs(qualifier1.key, qualifier2.key)
+        self.assertEqual(qualifier1.value, qualifier2.value)
+
+    def test_copy_source(self):
+        source1 = gb_io.Source("Testus organismae", "Testus")
+        source2 = copy.copy(source1)
+        self.assertIsNot(source1, source2)
+        self.assertEqual(source1.name, source2.name)
+        self.assertEqual(source1.organism, source2.organism)
+
+    def test_copy_reference(self):
+        reference1 = self.records[0].references[0]
+        reference2 = copy.copy(reference1)
+        self.assertIsNot(reference1, reference2)
+        self.assertEqual(reference1.title, reference2.title)
+        self.assertEqual(reference1.authors, reference2.authors)
+        self.assertEqual(reference1.journal, reference2.journal)